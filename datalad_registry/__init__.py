@@ -9,7 +9,7 @@ from werkzeug.exceptions import HTTPException
 
 from . import overview, root
 from .conf import OperationMode, compile_config_from_env
-from .models import db, init_db_command, migrate
+from .models import db, migrate, register_cli
 from .utils.pydantic_json import pydantic_dumps, pydantic_loads
 
 __version__ = version("datalad-registry")
@@ -49,7 +49,7 @@ def create_app() -> Flask:
     migrate.init_app(app, db)
 
     # Register CLI commands
-    app.cli.add_command(init_db_command)
+    register_cli(app)
 
     # Register Web UI blueprints
     app.register_blueprint(overview.bp)
@@ -75,7 +75,7 @@ def create_app() -> Flask:
             # replace the body with JSON
             response.data = HTTPExceptionResp(
                 code=e.code, name=e.name, description=e.description
-            ).json()
+            ).model_dump_json()
             response.content_type = "application/json"
             return response
         else:
@@ -1,18 +1,21 @@
 # This file is for defining the API endpoints related to dataset URls
 
-from json import loads
+from functools import cached_property
 import operator
 from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
 
 from celery import group
 from flask import abort, current_app, url_for
 from flask_openapi3 import APIBlueprint, Tag
+from flask_sqlalchemy.pagination import Pagination
 from lark.exceptions import GrammarError, UnexpectedInput
 from psycopg2.errors import UniqueViolation
 from sqlalchemy import ColumnElement, and_, select
 from sqlalchemy.exc import IntegrityError
 
-from datalad_registry.models import RepoUrl, db
+from datalad_registry.models import RepoUrl, URLMetadata, db
 from datalad_registry.search import parse_query
 from datalad_registry.tasks import (
     extract_ds_meta,
@@ -20,14 +23,14 @@ from datalad_registry.tasks import (
     mark_for_chk,
     process_dataset_url,
 )
-from datalad_registry.utils.flask_tools import json_resp_from_str
+from datalad_registry.utils.flask_tools import RowPagination, json_resp_from_str
 
 from .models import (
     DatasetURLPage,
-    DatasetURLRespBaseModel,
     DatasetURLRespModel,
     DatasetURLSubmitModel,
     MetadataReturnOption,
+    OrderDir,
     OrderKey,
     PathParams,
     QueryParams,
@@ -39,7 +42,7 @@ from .. import (
     DATASET_URLS_PATH,
     HTTPExceptionResp,
 )
-from ..url_metadata.models import URLMetadataRef
+from ..url_metadata.models import URLMetadataModel, URLMetadataRef
 from ..utils import disable_in_read_only_mode
 
 _ORDER_KEY_TO_SQLA_ATTR = {
@@ -51,6 +54,98 @@ _ORDER_KEY_TO_SQLA_ATTR = {
     OrderKey.git_objects_kb: RepoUrl.git_objects_kb,
 }
 
+
+def _get_ordering(key: OrderKey, dir_: OrderDir) -> ColumnElement:
+    """
+    Get the clause for ordering dataset URLs by a given key in a given direction
+
+    Nulls are placed last. The ordering by `url`, which is not nullable, is left
+    without `NULLS LAST` so that the unique index of the column can serve it in
+    both directions.
+    """
+    col = _ORDER_KEY_TO_SQLA_ATTR[key]
+    ordering = col.asc() if dir_ is OrderDir.asc else col.desc()
+    return ordering if key is OrderKey.url else ordering.nulls_last()
+
+
+# The ordering clause for each combination of order key and order direction
+_ORDERING = {
+    (key, dir_): _get_ordering(key, dir_) for key in OrderKey for dir_ in OrderDir
+}
+
+# Columns of `RepoUrl` that populate the fields of `DatasetURLRespModel` directly
+_RESP_COLUMNS = tuple(
+    getattr(RepoUrl, name) for name in DatasetURLRespModel._orm_field_names
+)
+
+# Columns of `URLMetadata` that populate the fields of `URLMetadataModel`
+_METADATA_CONTENT_COLUMNS = tuple(
+    getattr(URLMetadata, name) for name in URLMetadataModel.model_fields
+)
+
+
+class _PageLinks:
+    """
+    Links to the previous, next, first, and last pages of a page of dataset URLs
+
+    All the links share the path and the query string, except for the `page` query
+    parameter, which are built only once.
+
+    Note: This requires an active request context of Flask
+    """
+
+    def __init__(self, query: QueryParams, pagination: Pagination):
+        """
+        :param query: The query parameters of the request for the current page
+        :param pagination: The pagination object of the current page
+        """
+        self._query = query
+        self._pagination = pagination
+
+    @cached_property
+    def _prefix(self) -> str:
+        """
+        The part of any of the links preceding the value of the `page` query parameter
+        """
+        # The query parameters other than `page` are sorted to produce the same
+        # query string for the same parameters
+        query_tail = urlencode(
+            sorted(
+                self._query.model_dump(
+                    mode="json", exclude={"page"}, exclude_none=True
+                ).items()
+            )
+        )
+        path = url_for(".dataset_urls")
+
+        return f"{path}?{query_tail}&page=" if query_tail else f"{path}?page="
+
+    def _link(self, page: int) -> str:
+        """
+        Get the link to a given page
+        """
+        return f"{self._prefix}{page}"
+
+    @cached_property
+    def prev_pg(self) -> Optional[str]:
+        pagination = self._pagination
+        return self._link(pagination.page - 1) if pagination.has_prev else None
+
+    @cached_property
+    def next_pg(self) -> Optional[str]:
+        pagination = self._pagination
+        return self._link(pagination.page + 1) if pagination.has_next else None
+
+    @cached_property
+    def first_pg(self) -> str:
+        return self._link(1)
+
+    @cached_property
+    def last_pg(self) -> str:
+        total_pages = self._pagination.pages
+        return self._link(1 if total_pages == 0 else total_pages)
+
+
 bp = APIBlueprint(
     "dataset_urls_api",
     __name__,
@@ -160,7 +255,9 @@ def declare_dataset_url(body: DatasetURLSubmitModel):
             raise RuntimeError(f"Failed to add the URL, {url_as_str}, to the database.")
 
         return json_resp_from_str(
-            DatasetURLRespModel.from_orm(repo_url_to_resp).json(exclude_none=True),
+            DatasetURLRespModel.model_validate(repo_url_to_resp).model_dump_json(
+                exclude_none=True
+            ),
             status=201,
         )
 
@@ -170,7 +267,9 @@ def declare_dataset_url(body: DatasetURLSubmitModel):
         repo_url = repo_url_row[0]
 
         # Build the response from the current representation of the URL in the DB
-        resp_model = DatasetURLRespModel.from_orm(repo_url).json(exclude_none=True)
+        resp_model = DatasetURLRespModel.model_validate(repo_url).model_dump_json(
+            exclude_none=True
+        )
 
         if repo_url.processed and repo_url.chk_req_dt is None:
             # === The dataset url has been processed and there is no unhandled request
@@ -247,7 +346,7 @@ def dataset_urls(query: QueryParams):
 
     append_column_constraint_arg_lst = [
         (RepoUrl.url, operator.eq, query.url, str),
-        (RepoUrl.ds_id, operator.eq, query.ds_id, str),
+        (RepoUrl.ds_id, operator.eq, query.ds_id),
         (RepoUrl.annex_key_count, operator.ge, query.min_annex_key_count),
         (RepoUrl.annex_key_count, operator.le, query.max_annex_key_count),
         (
@@ -283,83 +382,88 @@ def dataset_urls(query: QueryParams):
 
     # ==== Gathering constraints from query parameters ends ====
 
-    ep = ".dataset_urls"  # Endpoint of `dataset_urls`
-    base_qry = loads(query.json(exclude={"page"}, exclude_none=True))
-
-    base_select_stmt = select(RepoUrl).filter(and_(True, *constraints))
+    filter_clause = and_(True, *constraints)
+    base_select_stmt = select(RepoUrl).filter(filter_clause)
 
     max_per_page = 100  # The overriding limit to `per_page` provided by the requester
-    pagination = db.paginate(
-        base_select_stmt.order_by(
-            getattr(
-                _ORDER_KEY_TO_SQLA_ATTR[query.order_by], query.order_dir.value
-            )().nulls_last()
-        ),
+
+    collection_stats = get_collection_stats(base_select_stmt)
+
+    # Paginate over the rows of only the columns needed for the response,
+    # bypassing the construction of ORM objects
+    pagination = RowPagination(
+        select=select(*_RESP_COLUMNS)
+        .filter(filter_clause)
+        .order_by(_ORDERING[(query.order_by, query.order_dir)]),
+        session=db.session(),
         page=query.page,
         per_page=query.per_page,
         max_per_page=max_per_page,
+        # The number of all the dataset URLs in the collection, which is already
+        # counted in gathering the collection stats
+        total=collection_stats.summary.ds_count,
     )
-    orm_ds_urls = pagination.items
+    ds_url_rows = pagination.items
     cur_pg_num = pagination.page
-    total_pages = pagination.pages  # Total number of pages
 
     if query.return_metadata is None:
         # === No metadata should be returned ===
 
-        # noinspection PyArgumentList
-        ds_urls = [
-            DatasetURLRespModel(
-                **DatasetURLRespBaseModel.from_orm(i).dict(), metadata_=None
-            )
-            for i in orm_ds_urls
-        ]
+        ds_urls = [DatasetURLRespModel.from_orm_fast(r) for r in ds_url_rows]
 
-    elif query.return_metadata is MetadataReturnOption.reference:
-        # === Metadata should be returned by reference ===
+    else:
+        # === Metadata should be returned ===
 
-        # noinspection PyArgumentList
-        ds_urls = [
-            DatasetURLRespModel(
-                **DatasetURLRespBaseModel.from_orm(i).dict(),
-                metadata_=[
+        # Get the metadata of all the dataset URLs in the current page in one query
+        metadata_by_url_id: dict[int, list] = {r.id: [] for r in ds_url_rows}
+
+        if query.return_metadata is MetadataReturnOption.reference:
+            # === Metadata should be returned by reference ===
+
+            for m in db.session.execute(
+                select(URLMetadata.url_id, URLMetadata.id, URLMetadata.extractor_name)
+                .filter(URLMetadata.url_id.in_(metadata_by_url_id))
+                .order_by(URLMetadata.id)
+            ):
+                metadata_by_url_id[m.url_id].append(
                     URLMetadataRef(
-                        extractor_name=j.extractor_name,
+                        extractor_name=m.extractor_name,
                         link=url_for(
-                            "url_metadata_api.url_metadata", url_metadata_id=j.id
+                            "url_metadata_api.url_metadata", url_metadata_id=m.id
                         ),
                     )
-                    for j in i.metadata_
-                ],
-            )
-            for i in orm_ds_urls
-        ]
+                )
 
-    else:
-        # === Metadata should be returned by content ===
+        else:
+            # === Metadata should be returned by content ===
+
+            for m in db.session.execute(
+                select(URLMetadata.url_id, *_METADATA_CONTENT_COLUMNS)
+                .filter(URLMetadata.url_id.in_(metadata_by_url_id))
+                .order_by(URLMetadata.id)
+            ):
+                metadata_by_url_id[m.url_id].append(URLMetadataModel.model_validate(m))
 
-        ds_urls = orm_ds_urls
+        ds_urls = [
+            DatasetURLRespModel.from_orm_fast(r, metadata=metadata_by_url_id[r.id])
+            for r in ds_url_rows
+        ]
 
     assert pagination.total is not None
 
+    page_links = _PageLinks(query, pagination)
+
     page = DatasetURLPage(
         cur_pg_num=cur_pg_num,
-        prev_pg=(
-            url_for(ep, **base_qry, page=pagination.prev_num)
-            if pagination.has_prev
-            else None
-        ),
-        next_pg=(
-            url_for(ep, **base_qry, page=pagination.next_num)
-            if pagination.has_next
-            else None
-        ),
-        first_pg=url_for(ep, **base_qry, page=1),
-        last_pg=url_for(ep, **base_qry, page=1 if total_pages == 0 else total_pages),
+        prev_pg=page_links.prev_pg,
+        next_pg=page_links.next_pg,
+        first_pg=page_links.first_pg,
+        last_pg=page_links.last_pg,
         dataset_urls=ds_urls,
-        collection_stats=get_collection_stats(base_select_stmt),
+        collection_stats=collection_stats,
     )
 
-    return json_resp_from_str(page.json(exclude_none=True))
+    return json_resp_from_str(page.model_dump_json(exclude_none=True))
 
 
 @bp.get("/<int:id>", responses={"200": DatasetURLRespModel})
@@ -367,5 +471,5 @@ def dataset_url(path: PathParams):
     """
     Get a dataset URL by ID.
     """
-    ds_url = DatasetURLRespModel.from_orm(db.get_or_404(RepoUrl, path.id))
-    return json_resp_from_str(ds_url.json(exclude_none=True))
+    ds_url = DatasetURLRespModel.model_validate(db.get_or_404(RepoUrl, path.id))
+    return json_resp_from_str(ds_url.model_dump_json(exclude_none=True))
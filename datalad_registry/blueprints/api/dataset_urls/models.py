@@ -1,28 +1,40 @@
 from datetime import datetime
 from enum import auto
 from pathlib import Path
-from typing import Optional, Union
+import re
+from typing import Annotated, Any, ClassVar, Optional, Union
+from urllib.parse import urlsplit
 from uuid import UUID
 
 from pydantic import (
-    AnyUrl,
+    AfterValidator,
     BaseModel,
+    ConfigDict,
+    Discriminator,
     Field,
-    FileUrl,
     NonNegativeInt,
     PositiveInt,
     StrictInt,
     StrictStr,
-    validator,
+    StringConstraints,
+    Tag,
+    TypeAdapter,
+    WithJsonSchema,
+    field_validator,
 )
 
 from datalad_registry.utils import StrEnum
+from datalad_registry.utils.pydantic_tls import AnyUrlStr
 
 from ..url_metadata.models import URLMetadataModel, URLMetadataRef
 
 DEFAULT_PAGE = 1  # Default page query param value
 DEFAULT_PER_PAGE = 20  # Default per_page query param value
 
+# Function for finding a `<scheme>://` prefix, after any leading whitespace,
+# in a string
+_SCHEME_AUTHORITY_PREFIX = re.compile(r"\s*[A-Za-z][A-Za-z0-9+.-]*://").match
+
 
 def path_url_must_be_absolute(url):
     """
@@ -33,6 +45,52 @@ def path_url_must_be_absolute(url):
     return url
 
 
+def url_must_have_authority(url: str) -> str:
+    """
+    Validator for the URL, as opposed to the path, of a dataset URL that ensures that
+    the URL is of the form `<scheme>://<authority>...` with a non-empty authority,
+    except for a `file` URL, which can have an empty authority, e.g. `file:///data`
+
+    Note: Pydantic URL types accept URLs without an authority, such as `file:` and
+          `foo://`, which are not acceptable as dataset URLs.
+    """
+    split_url = urlsplit(url)
+    if not split_url.netloc and not (split_url.scheme == "file" and url[5:7] == "//"):
+        raise ValueError("URL must be of the form `<scheme>://<authority>...`")
+    return url
+
+
+# Type of a dataset URL that is a URL, as opposed to a path. The URL is kept as given,
+# without the normalization done by the Pydantic URL types, since dataset URLs are
+# stored and looked up as given.
+_DatasetURLStr = Annotated[
+    AnyUrlStr,
+    StringConstraints(strip_whitespace=True),
+    AfterValidator(url_must_have_authority),
+]
+
+
+def url_or_path_tag(v: Any) -> str:
+    """
+    Discriminator of `URLOrPath` that selects the member of the union to validate
+    a value against
+
+    A string starting with `<scheme>://` is validated as a URL. Any other value is
+    validated as a path, sparing path strings from a doomed attempt at URL validation.
+    """
+    return "url" if isinstance(v, str) and _SCHEME_AUTHORITY_PREFIX(v) else "path"
+
+
+# Type of a dataset URL, a URL or a path
+URLOrPath = Annotated[
+    Union[Annotated[_DatasetURLStr, Tag("url")], Annotated[Path, Tag("path")]],
+    Discriminator(url_or_path_tag),
+    # The JSON schema of a tagged union is a `oneOf` of its members, which a URL
+    # string, matching both members, fails. Keep the `anyOf` of the untagged union.
+    WithJsonSchema(TypeAdapter(Union[_DatasetURLStr, Path]).json_schema()),
+]
+
+
 class OrderDir(StrEnum):
     """
     Enum for representing the order directions
@@ -85,10 +143,10 @@ class QueryParams(BaseModel):
         "offered by the Web UI. Please consult the Web UI for the expected "
         "syntax of this search string by clicking on "
         'the "Show Search Query Syntax" button.',
-        regex=r".*\S.*",
+        pattern=r"\S",
     )
 
-    url: Optional[Union[FileUrl, AnyUrl, Path]] = Field(None, description="The URL")
+    url: Optional[URLOrPath] = Field(None, description="The URL")
 
     ds_id: Optional[UUID] = Field(None, description="The ID, a UUID, of the dataset")
 
@@ -182,10 +240,8 @@ class QueryParams(BaseModel):
         OrderDir.desc, description="The direction to order the items in the query"
     )
 
-    # Validator
-    _path_url_must_be_absolute = validator("url", allow_reuse=True)(
-        path_url_must_be_absolute
-    )
+    # Validators
+    _path_url_must_be_absolute = field_validator("url")(path_url_must_be_absolute)
 
 
 class DatasetURLSubmitModel(BaseModel):
@@ -193,12 +249,10 @@ class DatasetURLSubmitModel(BaseModel):
     Model for representing the database model RepoUrl for submission communication
     """
 
-    url: Union[FileUrl, AnyUrl, Path] = Field(..., description="The URL")
+    url: URLOrPath = Field(..., description="The URL")
 
     # Validator
-    _path_url_must_be_absolute = validator("url", allow_reuse=True)(
-        path_url_must_be_absolute
-    )
+    _path_url_must_be_absolute = field_validator("url")(path_url_must_be_absolute)
 
 
 class DatasetURLRespBaseModel(DatasetURLSubmitModel):
@@ -237,9 +291,7 @@ class DatasetURLRespBaseModel(DatasetURLSubmitModel):
         None, description="The datetime the last check for update was performed"
     )
 
-    class Config:
-        orm_mode = True
-        allow_population_by_field_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class DatasetURLRespModel(DatasetURLRespBaseModel):
@@ -248,13 +300,42 @@ class DatasetURLRespModel(DatasetURLRespBaseModel):
     """
 
     metadata: Optional[Union[list[URLMetadataModel], list[URLMetadataRef]]] = Field(
-        None, alias="metadata_", description="The metadata of the dataset at the URL"
-    )
-
-    class Config:
-        # Ensure the JSON schema of the model uses the field name
-        # instead of the alias to name a field
-        by_alias = False
+        None,
+        validation_alias="metadata_",
+        description="The metadata of the dataset at the URL",
+    )
+
+    _orm_field_names: ClassVar[tuple[str, ...]]
+
+    @classmethod
+    def from_orm_fast(
+        cls,
+        orm_obj: Any,
+        metadata: Optional[Union[list[URLMetadataModel], list[URLMetadataRef]]] = None,
+    ) -> "DatasetURLRespModel":
+        """
+        Create an instance of this model from a `RepoUrl` ORM object, or a row of
+        `RepoUrl` columns with the same attributes, without validation
+
+        :param orm_obj: The `RepoUrl` ORM object or row
+        :param metadata: The value for the `metadata` field
+        :return: The created instance
+
+        Note: This is meant only for ORM objects loaded from the database, the data
+              of which are trusted. The values of the fields are taken as is, e.g.,
+              `url` remains a `str` object, which serializes to the same JSON as
+              its validated counterpart. For untrusted input, use `model_validate()`
+              instead.
+        """
+        return cls.model_construct(
+            **{name: getattr(orm_obj, name) for name in cls._orm_field_names},
+            metadata=metadata,
+        )
+
+
+# Names of the fields of `DatasetURLRespModel` that are populated from an orm model
+# object directly, computed once instead of on every `from_orm_fast()` call
+DatasetURLRespModel._orm_field_names = tuple(DatasetURLRespBaseModel.model_fields)
 
 
 class AnnexDsCollectionStats(BaseModel):
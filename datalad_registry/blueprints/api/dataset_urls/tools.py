@@ -202,7 +202,7 @@ def get_collection_stats(select_stmt: Select) -> CollectionStats:
     # Total number of datasets, as individual repos, without any deduplication
     ds_count_scalar_subq = select(func.count()).select_from(base_cte).scalar_subquery()
 
-    return CollectionStats.parse_obj(
+    return CollectionStats.model_validate(
         db.session.execute(
             select(
                 func.jsonb_build_object(
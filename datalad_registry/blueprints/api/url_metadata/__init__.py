@@ -4,6 +4,7 @@
 from flask_openapi3 import APIBlueprint, Tag
 
 from datalad_registry.models import URLMetadata, db
+from datalad_registry.utils.flask_tools import json_resp_from_str
 
 from .models import PathParams, URLMetadataModel
 from .. import API_URL_PREFIX, COMMON_API_RESPONSES, URL_METADATA_PATH
@@ -22,5 +23,7 @@ def url_metadata(path: PathParams):
     """
     Get URL metadata by ID.
     """
-    data = URLMetadataModel.from_orm(db.get_or_404(URLMetadata, path.url_metadata_id))
-    return data.dict()
+    data = URLMetadataModel.model_validate(
+        db.get_or_404(URLMetadata, path.url_metadata_id)
+    )
+    return json_resp_from_str(data.model_dump_json())
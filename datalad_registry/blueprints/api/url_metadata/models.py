@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 
 class PathParams(BaseModel):
@@ -31,8 +31,7 @@ class URLMetadataModel(_URLMetadataRep):
     extraction_parameter: dict
     extracted_metadata: Any
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class URLMetadataRef(_URLMetadataRep):
@@ -48,7 +48,7 @@ def disable_in_read_only_mode(view_func):
                     remaining_supported_methods.update(rule.methods)
 
             return json_resp_from_str(
-                resp_body.json(exclude_none=True),
+                resp_body.model_dump_json(exclude_none=True),
                 status=resp_status,
                 headers={"Allow": ", ".join(remaining_supported_methods)},
             )
@@ -2,18 +2,12 @@ from enum import auto
 from pathlib import Path
 from typing import Any, Literal, Union
 
-from pydantic import (
-    AnyHttpUrl,
-    BaseSettings,
-    NonNegativeInt,
-    PositiveFloat,
-    PostgresDsn,
-    validator,
-)
+from pydantic import NonNegativeInt, PositiveFloat, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from datalad_registry.utils.misc import StrEnum
 
-from .utils.pydantic_tls import path_must_be_absolute
+from .utils.pydantic_tls import AnyHttpUrlStr, PostgresDsnStr, path_must_be_absolute
 
 
 class OperationMode(StrEnum):
@@ -32,7 +26,7 @@ class BaseConfig(OperationConfig):
     DATALAD_REGISTRY_DATASET_CACHE: Path
 
     # URL for any service to reach the web service API of the DataLad-Registry instance
-    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrl
+    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrlStr
 
     # URL check dispatcher related configuration
     DATALAD_REGISTRY_MIN_CHK_INTERVAL_PER_URL: NonNegativeInt = 3600  # seconds
@@ -87,18 +81,15 @@ class BaseConfig(OperationConfig):
 
     # =============================================
 
-    SQLALCHEMY_DATABASE_URI: PostgresDsn
+    SQLALCHEMY_DATABASE_URI: PostgresDsnStr
 
     TESTING: bool = False
 
-    _path_must_be_absolute = validator(
-        "DATALAD_REGISTRY_INSTANCE_PATH",
-        "DATALAD_REGISTRY_DATASET_CACHE",
-        allow_reuse=True,
+    _path_must_be_absolute = field_validator(
+        "DATALAD_REGISTRY_INSTANCE_PATH", "DATALAD_REGISTRY_DATASET_CACHE"
     )(path_must_be_absolute)
 
-    class Config:
-        case_sensitive = True
+    model_config = SettingsConfigDict(case_sensitive=True)
 
 
 class ProductionConfig(BaseConfig):
@@ -118,9 +109,7 @@ class TestingConfig(BaseConfig):
     # Web service is not available in testing mode.
     # The following overrides unneeded fields from `BaseConfig` with default values
     # to make them optional.
-    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrl = AnyHttpUrl(
-        url="http://dummy.url", scheme="http"
-    )
+    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrlStr = "http://dummy.url"
 
     TESTING: bool = True
 
@@ -139,9 +128,7 @@ class ReadOnlyConfig(BaseConfig):
     # The following overrides unneeded fields from `BaseConfig` with default values
     # to make them optional.
     DATALAD_REGISTRY_DATASET_CACHE: Path = Path("/dummy/path")
-    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrl = AnyHttpUrl(
-        url="http://dummy.url", scheme="http"
-    )
+    DATALAD_REGISTRY_WEB_API_URL: AnyHttpUrlStr = "http://dummy.url"
     CELERY_BROKER_URL: str = "dummy://"
     CELERY_RESULT_BACKEND: str = "dummy://"
 
@@ -1,9 +1,7 @@
 from pathlib import Path
 from typing import Optional
 
-import click
-from flask import current_app
-from flask.cli import with_appcontext
+from flask import Flask, current_app
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.dialects.postgresql import JSONB
@@ -17,7 +15,7 @@ class RepoUrl(db.Model):  # type: ignore
     # ==== Fields mainly for data records ====
     id = db.Column(db.Integer, primary_key=True, nullable=False)
     url = db.Column(db.Text, nullable=False, unique=True)
-    ds_id = db.Column(db.Text, nullable=True)
+    ds_id = db.Column(db.Uuid, nullable=True)
     annex_uuid = db.Column(db.Text)
     annex_key_count = db.Column(db.Integer)
     annexed_files_in_wt_count = db.Column(db.Integer)
@@ -60,6 +58,42 @@ class RepoUrl(db.Model):  # type: ignore
     # e.g. `/` in *nix
     cache_path = db.Column(db.String(34), default=None)
 
+    # Indexes for the orderings, other than the one by `url`, offered by the dataset
+    # URL list API endpoint for requests filtering by `processed`. The endpoint places
+    # nulls last and orders in descending order by default, so each index is built in
+    # `DESC NULLS LAST` order to serve the default direction.
+    # Note: These indexes serve neither the requests that don't filter by `processed`
+    #       nor the ascending orderings, since a backward scan of them yields
+    #       `ASC NULLS FIRST`. The ordering by `url`, a non-nullable column, is served
+    #       in both directions by the unique index of the column.
+    __table_args__ = (
+        db.Index(
+            "ix_repo_url_processed_last_update_dt",
+            processed,
+            last_update_dt.desc().nulls_last(),
+        ),
+        db.Index(
+            "ix_repo_url_processed_annex_key_count",
+            processed,
+            annex_key_count.desc().nulls_last(),
+        ),
+        db.Index(
+            "ix_repo_url_processed_annexed_files_in_wt_count",
+            processed,
+            annexed_files_in_wt_count.desc().nulls_last(),
+        ),
+        db.Index(
+            "ix_repo_url_processed_annexed_files_in_wt_size",
+            processed,
+            annexed_files_in_wt_size.desc().nulls_last(),
+        ),
+        db.Index(
+            "ix_repo_url_processed_git_objects_kb",
+            processed,
+            git_objects_kb.desc().nulls_last(),
+        ),
+    )
+
     metadata_ = db.relationship(
         "URLMetadata", back_populates="url", cascade_backrefs=False
     )
@@ -113,7 +147,22 @@ class URLMetadata(db.Model):  # type: ignore
         )
 
 
-@click.command("init-db")
-@with_appcontext
-def init_db_command() -> None:
-    db.create_all()
+def register_cli(app: Flask) -> None:
+    """
+    Register the CLI commands related to the database with a given Flask app
+
+    :param app: The given Flask app
+
+    Note: The CLI-only dependencies are imported here, on registration, instead of
+          at the import of this module, which is also imported by the web and
+          Celery workers that never run these commands.
+    """
+    import click
+    from flask.cli import with_appcontext
+
+    @click.command("init-db")
+    @with_appcontext
+    def init_db_command() -> None:
+        db.create_all()
+
+    app.cli.add_command(init_db_command)
@@ -5,7 +5,7 @@ from functools import partial
 import logging
 
 from lark import GrammarError, Lark, Token, Transformer, Tree, v_args
-from sqlalchemy import CollectionAggregate, ColumnElement, Text, and_, not_, or_
+from sqlalchemy import CollectionAggregate, ColumnElement, String, Text, and_, not_, or_
 
 from .models import RepoUrl, URLMetadata
 
@@ -34,6 +34,9 @@ known_fields_RepoUrl_1to1 = ["url", "ds_id", "head", "head_describe", "tags"]
 
 def get_ilike_search(model, field: str, value: str):
     model_field = getattr(model, field)
+    if not isinstance(model_field.type, String):
+        # Search a non-string field, e.g., the UUID `ds_id`, in its text form
+        model_field = model_field.cast(Text)
     return and_(
         model_field.is_not(None),
         model_field.ilike(_escape_for_ilike(value), escape=escape),
@@ -13,7 +13,7 @@ from datalad.distribution.dataset import require_dataset
 from datalad.support.exceptions import IncompleteResultsError
 from datalad.utils import rmtree as rm_ds_tree
 from flask import current_app
-from pydantic import StrictInt, StrictStr, parse_obj_as, validate_arguments
+from pydantic import StrictInt, StrictStr, TypeAdapter, validate_call
 import requests
 from sqlalchemy import and_, case, not_, or_, select
 from yarl import URL
@@ -38,6 +38,9 @@ from ..blueprints.api import DATASET_URLS_PATH
 
 lgr = get_task_logger(__name__)
 
+# Adapter for validating the results of `datalad.api.meta_extract()`
+_META_EXTRACT_RESULTS_ADAPTER = TypeAdapter(list[MetaExtractResult])
+
 
 class ExtractMetaStatus(StrEnum):
     SUCCEEDED = auto()
@@ -138,7 +141,7 @@ def log_error(request, exc, traceback) -> None:
 
 # `acks_late` is set. Make sure this task is always idempotent
 @shared_task(acks_late=True)
-@validate_arguments
+@validate_call
 def extract_ds_meta(ds_url_id: StrictInt, extractor: StrictStr) -> ExtractMetaStatus:
     """
     Extract dataset level metadata from a dataset
@@ -167,13 +170,7 @@ def extract_ds_meta(ds_url_id: StrictInt, extractor: StrictStr) -> ExtractMetaSt
     """
 
     # Get the RepoUrl from the database by ID with a read/share lock
-    url = (
-        db.session.execute(
-            select(RepoUrl).filter_by(id=ds_url_id).with_for_update(read=True)
-        )
-        .scalars()
-        .one_or_none()
-    )
+    url = db.session.get(RepoUrl, ds_url_id, with_for_update={"read": True})
 
     if url is None:
         # === there is no RepoUrl in the database with the specified ID ===
@@ -231,8 +228,7 @@ def extract_ds_meta(ds_url_id: StrictInt, extractor: StrictStr) -> ExtractMetaSt
             purpose=f"{extractor} metadata extraction",
         )
 
-        results = parse_obj_as(
-            list[MetaExtractResult],
+        results = _META_EXTRACT_RESULTS_ADAPTER.validate_python(
             dl.meta_extract(
                 extractor,
                 dataset=ds,
@@ -286,7 +282,7 @@ def extract_ds_meta(ds_url_id: StrictInt, extractor: StrictStr) -> ExtractMetaSt
     max_retries=4,
     retry_backoff=100,
 )
-@validate_arguments
+@validate_call
 def process_dataset_url(dataset_url_id: StrictInt) -> ProcessUrlStatus:
     """
     Process a RepoUrl
@@ -313,13 +309,7 @@ def process_dataset_url(dataset_url_id: StrictInt) -> ProcessUrlStatus:
     """
 
     # Get the RepoUrl from the database by ID
-    dataset_url: Optional[RepoUrl] = (
-        db.session.execute(
-            select(RepoUrl).filter_by(id=dataset_url_id).with_for_update()
-        )
-        .scalars()
-        .one_or_none()
-    )
+    dataset_url = db.session.get(RepoUrl, dataset_url_id, with_for_update=True)
 
     if dataset_url is None:
         # === there is no RepoUrl in the database with the specified ID ===
@@ -371,7 +361,7 @@ def process_dataset_url(dataset_url_id: StrictInt) -> ProcessUrlStatus:
 
 
 @shared_task
-@validate_arguments
+@validate_call
 def mark_for_chk(url_id: StrictInt) -> None:
     """
     Mark a dataset url for check for update with a timestamp as the value of
@@ -381,11 +371,7 @@ def mark_for_chk(url_id: StrictInt) -> None:
     """
 
     # Select and lock the dataset url to be marked for update check
-    url: Optional[RepoUrl] = (
-        db.session.execute(select(RepoUrl).filter_by(id=url_id).with_for_update())
-        .scalars()
-        .one_or_none()
-    )
+    url = db.session.get(RepoUrl, url_id, with_for_update=True)
 
     # Note: It is possible that there is no `RepoUrl` record with the given ID
     #       (possibly due to deletion).
@@ -502,7 +488,7 @@ def url_chk_dispatcher() -> list[int]:
 
 
 @shared_task
-@validate_arguments
+@validate_call
 def chk_url_to_update(
     url_id: StrictInt, initial_last_chk_dt: Optional[datetime]
 ) -> ChkUrlStatus:
@@ -521,13 +507,7 @@ def chk_url_to_update(
 
     # Select and lock the RepoUrl identified by the given ID if it is not locked
     # by another transaction
-    url = (
-        db.session.execute(
-            select(RepoUrl).filter_by(id=url_id).with_for_update(skip_locked=True)
-        )
-        .scalars()
-        .one_or_none()
-    )
+    url = db.session.get(RepoUrl, url_id, with_for_update={"skip_locked": True})
 
     if url is None:
         # ===
@@ -676,7 +656,7 @@ def usage_dashboard_sync() -> UsageDashboardSyncResult:
     # Fetch repositories from datalad-usage-dashboard
     resp = requests.get(DASHBOARD_COLLECTION_URL)
     resp.raise_for_status()
-    dashboard_collection = DashboardCollection.parse_raw(resp.text)
+    dashboard_collection = DashboardCollection.model_validate_json(resp.text)
 
     # Get the set of active repositories from the usage dashboard identified by their
     # URL for cloning in `str` form
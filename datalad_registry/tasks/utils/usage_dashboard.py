@@ -49,7 +49,7 @@ class GHRepo(Repo):
     in the datalad-usage-dashboard
     """
 
-    id: Optional[StrictInt]
+    id: Optional[StrictInt] = None
     stars: StrictInt
     dataset: bool
     run: bool
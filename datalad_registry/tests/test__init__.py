@@ -82,7 +82,7 @@ class TestCreateApp:
             },
         }
 
-        default_metadata_extractors = BaseConfig.__fields__[
+        default_metadata_extractors = BaseConfig.model_fields[
             "DATALAD_REGISTRY_METADATA_EXTRACTORS"
         ].default
 
@@ -38,6 +38,10 @@ class TestDeclareDatasetURL:
             {"url": "hehe"},
             {"url": "haha/hehe"},
             {"url": "www.example.com"},
+            {"url": "file:/haha/hehe"},
+            {"url": "foo://"},
+            {"url": "https:///haha"},
+            {"url": "datalad-annex::https://example.com"},
         ],
     )
     def test_invalid_body(self, flask_client, request_json_body):
@@ -53,7 +57,7 @@ class TestDeclareDatasetURL:
         assert resp.status_code == 201
 
         # Ensure the response body is valid
-        DatasetURLRespModel.parse_raw(resp.text)
+        DatasetURLRespModel.model_validate_json(resp.text)
 
     def test_retrieve_blocking_record(self, flask_client, monkeypatch):
         """
@@ -155,7 +159,7 @@ class TestDeclareDatasetURL:
         assert resp.status_code == 202
 
         # Ensure the response body is valid
-        DatasetURLRespModel.parse_raw(resp.text)
+        DatasetURLRespModel.model_validate_json(resp.text)
 
         if expected_mark_for_chk_delay_args is None:
             mark_for_chk_delay_mock.assert_not_called()
@@ -185,6 +189,8 @@ class TestDatasetURLs:
         "query_params",
         [
             {"url": "www.example.com"},
+            {"url": "foo://"},
+            {"url": "datalad-annex::https://example.com"},
             {"ds_id": "34"},
             {"min_annex_key_count": "ab"},
             {"max_annex_key_count": "bc"},
@@ -227,6 +233,8 @@ class TestDatasetURLs:
         "query_params",
         [
             {"url": "https://www.example.com"},
+            {"url": "/data/ds"},
+            {"url": "file:///data/ds"},
             {"ds_id": "2a0b7b7b-a984-4c4a-844c-be3132291d7b"},
             {"min_annex_key_count": "1"},
             {"max_annex_key_count": 2},
@@ -403,7 +411,7 @@ class TestDatasetURLs:
         resp = flask_client.get("/api/v2/dataset-urls", query_string=query_params)
         assert resp.status_code == 200
 
-        ds_url_page = DatasetURLPage.parse_raw(resp.text)
+        ds_url_page = DatasetURLPage.model_validate_json(resp.text)
 
         assert ds_url_page.cur_pg_num == DEFAULT_PAGE
         assert ds_url_page.prev_pg is None
@@ -475,7 +483,7 @@ class TestDatasetURLs:
         assert resp.status_code == 200
 
         resp_json = resp.json
-        ds_url_pg = DatasetURLPage.parse_obj(resp_json)
+        ds_url_pg = DatasetURLPage.model_validate(resp_json)
 
         if metadata_ret_opt is None:
             # === metadata is not returned ===
@@ -515,7 +523,7 @@ class TestDatasetURLs:
         assert resp.status_code == 200
 
         resp_json = resp.json
-        ds_url_pg = DatasetURLPage.parse_obj(resp_json)
+        ds_url_pg = DatasetURLPage.model_validate(resp_json)
 
         assert ds_url_pg.cur_pg_num == 1
         assert "prev_pg" not in resp_json
@@ -553,7 +561,7 @@ class TestDatasetURLs:
         assert resp.status_code == 200
 
         resp_json = resp.json
-        ds_url_pg = DatasetURLPage.parse_obj(resp_json)
+        ds_url_pg = DatasetURLPage.model_validate(resp_json)
 
         assert ds_url_pg.cur_pg_num == 2
         assert ds_url_pg.prev_pg is not None
@@ -666,7 +674,7 @@ class TestDatasetURLs:
 
             assert resp.status_code == 200
 
-            ds_url_pg = DatasetURLPage.parse_raw(resp.text)
+            ds_url_pg = DatasetURLPage.model_validate_json(resp.text)
 
             results_by_id.extend(url.id for url in ds_url_pg.dataset_urls)
 
@@ -916,7 +924,10 @@ class TestDatasetURLs:
 
         resp = flask_client.get("/api/v2/dataset-urls", query_string=query_params)
 
-        assert DatasetURLPage.parse_raw(resp.text).collection_stats == expected_stats
+        assert (
+            DatasetURLPage.model_validate_json(resp.text).collection_stats
+            == expected_stats
+        )
 
 
 @pytest.mark.usefixtures("populate_with_2_dataset_urls")
@@ -934,7 +945,7 @@ class TestDatasetURL:
         assert resp.status_code == 200
 
         # Ensure the response body is valid
-        ds_url = DatasetURLRespModel.parse_raw(resp.text)
+        ds_url = DatasetURLRespModel.model_validate_json(resp.text)
 
         # Ensure the correct URL is fetched
         assert str(ds_url.url) == url
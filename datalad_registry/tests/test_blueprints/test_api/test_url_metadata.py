@@ -42,7 +42,8 @@ def populated_metadata(flask_app) -> list[URLMetadataModel]:
         db.session.commit()
 
         return [
-            URLMetadataModel.from_orm(url_metadata) for url_metadata in url_metadata_lst
+            URLMetadataModel.model_validate(url_metadata)
+            for url_metadata in url_metadata_lst
         ]
 
 
@@ -59,7 +60,7 @@ class TestURLMetadata:
 
         assert resp.status_code == 200
 
-        returned_metadata = URLMetadataModel.parse_obj(resp.json)
+        returned_metadata = URLMetadataModel.model_validate(resp.json)
         expected_metadata = populated_metadata[url_metadata_id - 1]
 
         assert returned_metadata == expected_metadata
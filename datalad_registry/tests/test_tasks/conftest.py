@@ -4,6 +4,7 @@ from pathlib import Path
 from datalad.api import Dataset
 from flask import Flask
 import pytest
+from sqlalchemy import delete
 
 from datalad_registry.models import RepoUrl, db
 from datalad_registry.tasks import process_dataset_url
@@ -23,21 +24,25 @@ def populate_db_with_unprocessed_dataset_urls(
 ):
     """
     Populate the database with unprocessed dataset URLs
+
+    Note: The rows are inserted in bulk through the table, without constructing
+          ORM objects.
     """
 
     with flask_app.app_context():
-        non_dataset_url = RepoUrl(url="https://www.datalad.org/")
-        db.session.add(non_dataset_url)  # id == 1
-
-        db.session.add(RepoUrl(url=TEST_MIN_REPO_URL))  # id == 2
-        db.session.add(RepoUrl(url=empty_ds_annex.path))  # id == 3
-        db.session.add(RepoUrl(url=empty_ds_non_annex.path))  # id == 4
-        db.session.add(RepoUrl(url=two_files_ds_annex.path))  # id == 5
-        db.session.add(RepoUrl(url=two_files_ds_non_annex.path))  # id == 6
-
-        db.session.commit()
+        db.session.execute(
+            RepoUrl.__table__.insert(),
+            [
+                {"url": "https://www.datalad.org/"},  # id == 1
+                {"url": TEST_MIN_REPO_URL},  # id == 2
+                {"url": empty_ds_annex.path},  # id == 3
+                {"url": empty_ds_non_annex.path},  # id == 4
+                {"url": two_files_ds_annex.path},  # id == 5
+                {"url": two_files_ds_non_annex.path},  # id == 6
+            ],
+        )
+        db.session.execute(delete(RepoUrl).where(RepoUrl.id == 1))
 
-        db.session.delete(non_dataset_url)
         db.session.commit()  # 1 is no longer a valid RepoUrl id
 
 
@@ -46,9 +46,7 @@ class TestExtractDsMeta:
         has no cache path
         """
         with flask_app.app_context():
-            url = db.session.execute(
-                db.select(RepoUrl).where(RepoUrl.id == url_id)
-            ).scalar_one()
+            url = db.session.get(RepoUrl, url_id)
             url.processed = True
             db.session.commit()
 
@@ -88,16 +86,14 @@ class TestExtractDsMeta:
         )
 
         with flask_app.app_context():
-            url = db.session.execute(
-                db.select(RepoUrl).where(RepoUrl.id == test_repo_url_id)
-            ).scalar_one()
+            url = db.session.get(RepoUrl, test_repo_url_id)
 
             metadata_lst = url.metadata_
 
             # Verify the number of pieces of metadata
             assert len(metadata_lst) == 1
 
-            metadata = URLMetadataModel.from_orm(metadata_lst[0])
+            metadata = URLMetadataModel.model_validate(metadata_lst[0])
 
             # Verify metadata saved to database
             assert metadata.dataset_describe == TEST_MIN_REPO_TAG
@@ -215,7 +211,7 @@ class TestExtractDsMeta:
         """
         repo_url = repo_url_with_up_to_date_clone[0]
 
-        def mock_parse_obj_as(*_args, **_kwargs):
+        def mock_meta_extract(*_args, **_kwargs):
             return [
                 MetaExtractResult(
                     action="meta_extract",
@@ -227,12 +223,12 @@ class TestExtractDsMeta:
                         extraction_parameter={},
                         extracted_metadata={"hello": "world"},
                     ),
-                )
+                ).model_dump()
             ]
 
         from datalad_registry import tasks
 
-        monkeypatch.setattr(tasks, "parse_obj_as", mock_parse_obj_as)
+        monkeypatch.setattr(tasks.dl, "meta_extract", mock_meta_extract)
 
         with pytest.raises(RuntimeError, match="The returned execution status"):
             extract_ds_meta(repo_url.id, _BASIC_EXTRACTOR)
@@ -57,9 +57,7 @@ class TestMarkForChk:
 
         # Verify the representation of the URL in the DB
         with flask_app.app_context():
-            repo_url: RepoUrl = db.session.execute(
-                db.select(RepoUrl).filter_by(id=url_id)
-            ).scalar_one()
+            repo_url: RepoUrl = db.session.get(RepoUrl, url_id)
 
             if expecting_chk_req_dt_changed:
                 if original_chk_req_dt is None:
@@ -42,9 +42,7 @@ def is_dataset_url_unprocessed(dataset_url_id: int) -> bool:
         if (f != "id" and f != "url" and f != "n_failed_chks" and f != "processed")
     ]
 
-    dataset_url: Optional[RepoUrl] = db.session.execute(
-        db.select(RepoUrl).filter_by(id=dataset_url_id)
-    ).scalar()
+    dataset_url: Optional[RepoUrl] = db.session.get(RepoUrl, dataset_url_id)
 
     if dataset_url is None:
         raise ValueError(f"Invalid RepoUrl ID: {dataset_url_id}")
@@ -93,9 +91,7 @@ class TestProcessDatasetUrl:
 
         with flask_app.app_context():
             # Retrieve the RepoUrl after processing
-            dataset_url: Optional[RepoUrl] = db.session.execute(
-                db.select(RepoUrl).filter_by(id=dataset_url_id)
-            ).scalar()
+            dataset_url: Optional[RepoUrl] = db.session.get(RepoUrl, dataset_url_id)
 
             assert (
                 time_before_processing
@@ -175,9 +171,7 @@ class TestProcessDatasetUrl:
 
         def get_cache_path_abs():
             with flask_app.app_context():
-                _dataset_url: Optional[RepoUrl] = db.session.execute(
-                    db.select(RepoUrl).filter_by(id=url_id)
-                ).scalar()
+                _dataset_url: Optional[RepoUrl] = db.session.get(RepoUrl, url_id)
 
                 return _dataset_url.cache_path_abs
 
@@ -194,8 +188,6 @@ class TestProcessDatasetUrl:
 
         # Verified that the dataset URL has been processed
         with flask_app.app_context():
-            dataset_url: Optional[RepoUrl] = db.session.execute(
-                db.select(RepoUrl).filter_by(id=url_id)
-            ).scalar()
+            dataset_url: Optional[RepoUrl] = db.session.get(RepoUrl, url_id)
 
             assert dataset_url.processed
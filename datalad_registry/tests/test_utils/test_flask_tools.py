@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import Row, select
+
+from datalad_registry.models import RepoUrl, db
+from datalad_registry.utils.flask_tools import RowPagination
+
+
+@pytest.mark.usefixtures("populate_with_std_ds_urls")
+class TestRowPagination:
+    def test_items(self, flask_app):
+        """
+        Test that the items are the rows of the paginated select statement
+        """
+        with flask_app.app_context():
+            pagination = RowPagination(
+                select=select(RepoUrl.id, RepoUrl.url).order_by(RepoUrl.url),
+                session=db.session(),
+                page=2,
+                per_page=3,
+            )
+
+            assert isinstance(pagination.items, list)
+            assert all(isinstance(item, Row) for item in pagination.items)
+            assert [item.url for item in pagination.items] == [
+                "https://www.example.com"
+            ]
+            assert pagination.total == 4
+            assert pagination.pages == 2
+
+    @pytest.mark.parametrize("total", [0, 4, 42])
+    def test_given_total(self, total, flask_app):
+        """
+        Test that a given total number of items is used as is instead of being counted
+        """
+        with flask_app.app_context():
+            pagination = RowPagination(
+                select=select(RepoUrl.id).order_by(RepoUrl.id),
+                session=db.session(),
+                page=1,
+                per_page=3,
+                total=total,
+            )
+
+            assert len(pagination.items) == 3
+            assert pagination.total == total
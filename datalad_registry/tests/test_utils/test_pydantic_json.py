@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, validate_arguments
+from pydantic import BaseModel, validate_call
 import pytest
 
 from datalad_registry.utils.pydantic_json import pydantic_dumps, pydantic_loads
@@ -39,22 +39,22 @@ def test_basic_types(test_input, expected_output):
 
 
 # ===== Test for supported complex standard types ============================
-@validate_arguments
+@validate_call
 def return_datetime(dt: datetime) -> datetime:
     return dt
 
 
-@validate_arguments
+@validate_call
 def return_decimal(dec: Decimal) -> Decimal:
     return dec
 
 
-@validate_arguments
+@validate_call
 def return_path(pth: Path) -> Path:
     return pth
 
 
-@validate_arguments
+@validate_call
 def return_uuid(uid: UUID) -> UUID:
     return uid
 
@@ -65,7 +65,7 @@ class FooData:
     b: str
 
 
-@validate_arguments
+@validate_call
 def return_foo_data(fd: FooData) -> FooData:
     return fd
 
@@ -99,7 +99,7 @@ def test_supported_complex_standard_types(io_put, process_func):
 # ==== Test for handling pydantic model types =================================
 class User(BaseModel):
     id: int
-    name = "Jane Doe"
+    name: str = "Jane Doe"
 
 
 class Foo(BaseModel):
@@ -108,8 +108,8 @@ class Foo(BaseModel):
 
 
 class Bar(BaseModel):
-    apple = "x"
-    banana = "y"
+    apple: str = "x"
+    banana: str = "y"
 
 
 class Spam(BaseModel):
@@ -123,22 +123,22 @@ user_lst = [user] * 42
 spam_lst = [spam] * 6
 
 
-@validate_arguments
+@validate_call
 def return_user(u: User) -> User:
     return u
 
 
-@validate_arguments
+@validate_call
 def return_spam(spm: Spam) -> Spam:
     return spm
 
 
-@validate_arguments
+@validate_call
 def return_list_of_users(user_list: List[User]) -> List[User]:
     return user_list
 
 
-@validate_arguments
+@validate_call
 def return_list_of_spams(spam_list: List[Spam]) -> List[Spam]:
     return spam_list
 
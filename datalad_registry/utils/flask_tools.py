@@ -1,4 +1,6 @@
 from flask import Response, current_app
+from flask_sqlalchemy.pagination import SelectPagination
+from sqlalchemy import Row
 
 
 def json_resp_from_str(json_str: str, **kwargs) -> Response:
@@ -15,3 +17,30 @@ def json_resp_from_str(json_str: str, **kwargs) -> Response:
           fixed to `application/json`.
     """
     return current_app.response_class(json_str, mimetype="application/json", **kwargs)
+
+
+class RowPagination(SelectPagination):
+    """
+    A variation of `flask_sqlalchemy.pagination.SelectPagination` of which the items
+    are the rows, as `sqlalchemy.Row` objects, of the paginated select statement
+    instead of the first column of each of the rows
+
+    Paginating a select statement of columns, instead of ORM entities, with this class
+    retrieves the items without constructing ORM objects for them.
+
+    Note: Create objects of this class with the same arguments as the ones
+          `flask_sqlalchemy.SQLAlchemy.paginate` uses to create objects of
+          `SelectPagination`, including the `select` and `session` keyword arguments.
+          Optionally, the total number of items can be provided through the `total`
+          keyword argument, if it is already known, to save the query counting them.
+    """
+
+    def _query_items(self) -> list[Row]:
+        select = self._query_args["select"]
+        select = select.limit(self.per_page).offset(self._query_offset)
+        session = self._query_args["session"]
+        return session.execute(select).all()
+
+    def _query_count(self) -> int:
+        total = self._query_args.get("total")
+        return super()._query_count() if total is None else total
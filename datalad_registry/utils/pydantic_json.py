@@ -3,11 +3,24 @@
 # These are the types that are allowed as a type for a field in a Pydantic model.
 # They include `datetime.datetime`, `decimal.Decimal`, `pathlib.Path`, `uuid.UUID`,
 # Pydantic models themselves, and more.
-# This serializer should be used in conjunction with the @validate_arguments decorator
+# This serializer should be used in conjunction with the @validate_call decorator
 # from Pydantic to allow the additional types to be passed to Celery tasks as arguments.
 
 from kombu.utils.json import dumps, loads
-from pydantic.json import pydantic_encoder
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+
+def pydantic_encoder(obj):
+    """
+    The `default` function for `json.dumps()` that converts an object of a type
+    supported by Pydantic to a JSON serializable object
+
+    :raises TypeError: If the object is not of a type supported by Pydantic
+    """
+    try:
+        return to_jsonable_python(obj)
+    except PydanticSerializationError as e:
+        raise TypeError(str(e)) from e
 
 
 def pydantic_dumps(obj):
@@ -1,6 +1,16 @@
 # Module for defining useful tools for use with Pydantic
 
 from pathlib import Path
+from typing import Annotated, Any, Callable
+
+from pydantic import (
+    AfterValidator,
+    AnyHttpUrl,
+    AnyUrl,
+    PostgresDsn,
+    TypeAdapter,
+    WithJsonSchema,
+)
 
 
 def path_must_be_absolute(p: Path) -> Path:
@@ -13,3 +23,43 @@ def path_must_be_absolute(p: Path) -> Path:
     if not p.is_absolute():
         raise ValueError("Path must be absolute")
     return p
+
+
+def validated_as(type_: Any) -> Callable[[str], str]:
+    """
+    Get a Pydantic validator for ensuring that a string is a valid value of a given type
+
+    :param type_: The given type
+    :return: The validator. It returns the string as is if the string is valid.
+
+    Note: This is for validating a string as a value of a type, such as a Pydantic URL
+          type, that converts the string to a normalized object of its own, in cases
+          where the string itself is to be kept.
+    """
+    adapter: TypeAdapter[Any] = TypeAdapter(type_)
+
+    def validator(s: str) -> str:
+        adapter.validate_python(s)
+        return s
+
+    return validator
+
+
+# === `str` counterparts of Pydantic URL types ===
+# A value of each of these types is validated as a value of the corresponding URL type
+# but is kept as the given string, i.e., it is not normalized
+AnyUrlStr = Annotated[
+    str,
+    AfterValidator(validated_as(AnyUrl)),
+    WithJsonSchema(TypeAdapter(AnyUrl).json_schema()),
+]
+AnyHttpUrlStr = Annotated[
+    str,
+    AfterValidator(validated_as(AnyHttpUrl)),
+    WithJsonSchema(TypeAdapter(AnyHttpUrl).json_schema()),
+]
+PostgresDsnStr = Annotated[
+    str,
+    AfterValidator(validated_as(PostgresDsn)),
+    WithJsonSchema(TypeAdapter(PostgresDsn).json_schema()),
+]
@@ -92,7 +92,7 @@ class RegistryGetURLs(Interface):
                 resp_status_code = resp.status_code
 
                 if resp_status_code == 200:
-                    ds_url_pg = DatasetURLPage.parse_raw(resp.text)
+                    ds_url_pg = DatasetURLPage.model_validate_json(resp.text)
                     ds_urls.extend(str(i.url) for i in ds_url_pg.dataset_urls)
 
                     if ds_url_pg.next_pg is None:
@@ -112,7 +112,7 @@ class TestRegistryGetURLs:
                             )
                         ],
                         collection_stats=collection_stats,
-                    ).json(exclude_none=True),
+                    ).model_dump_json(exclude_none=True),
                 )
             else:
                 return MockResponse(404, "Not Found")
@@ -163,7 +163,7 @@ class TestRegistryGetURLs:
                             )
                         ],
                         collection_stats=collection_stats,
-                    ).json(exclude_none=True),
+                    ).model_dump_json(exclude_none=True),
                 )
             else:
                 return MockResponse(404, "Not Found")
@@ -220,7 +220,7 @@ class TestRegistryGetURLs:
             # noinspection PyTypeChecker
             return MockResponse(
                 200,
-                next(ds_url_pgs_iter).json(exclude_none=True),
+                next(ds_url_pgs_iter).model_dump_json(exclude_none=True),
             )
 
         monkeypatch.setattr(requests.Session, "get", mock_get)
@@ -276,7 +276,7 @@ class TestRegistryGetURLs:
                             )
                         ],
                         collection_stats=collection_stats,
-                    ).json(exclude_none=True),
+                    ).model_dump_json(exclude_none=True),
                 )
 
         mock_resp_iter = mock_responses()
@@ -0,0 +1,38 @@
+"""Change RepoUrl.ds_id to UUID
+
+Revision ID: 8b982ca8272a
+Revises: 7d283978c4a9
+Create Date: 2026-10-15 22:52:31.418067
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8b982ca8272a"
+down_revision = "7d283978c4a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("repo_url", schema=None) as batch_op:
+        batch_op.alter_column(
+            "ds_id",
+            existing_type=sa.Text(),
+            type_=sa.Uuid(),
+            existing_nullable=True,
+            postgresql_using="ds_id::uuid",
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("repo_url", schema=None) as batch_op:
+        batch_op.alter_column(
+            "ds_id",
+            existing_type=sa.Uuid(),
+            type_=sa.Text(),
+            existing_nullable=True,
+            postgresql_using="ds_id::text",
+        )
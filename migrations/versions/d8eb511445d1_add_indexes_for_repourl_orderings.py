@@ -0,0 +1,54 @@
+"""Add indexes for RepoUrl orderings
+
+Revision ID: d8eb511445d1
+Revises: 8b982ca8272a
+Create Date: 2026-10-15 23:31:12.604519
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d8eb511445d1"
+down_revision = "8b982ca8272a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("repo_url", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_repo_url_processed_last_update_dt",
+            ["processed", sa.text("last_update_dt DESC NULLS LAST")],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_repo_url_processed_annex_key_count",
+            ["processed", sa.text("annex_key_count DESC NULLS LAST")],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_repo_url_processed_annexed_files_in_wt_count",
+            ["processed", sa.text("annexed_files_in_wt_count DESC NULLS LAST")],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_repo_url_processed_annexed_files_in_wt_size",
+            ["processed", sa.text("annexed_files_in_wt_size DESC NULLS LAST")],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_repo_url_processed_git_objects_kb",
+            ["processed", sa.text("git_objects_kb DESC NULLS LAST")],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("repo_url", schema=None) as batch_op:
+        batch_op.drop_index("ix_repo_url_processed_git_objects_kb")
+        batch_op.drop_index("ix_repo_url_processed_annexed_files_in_wt_size")
+        batch_op.drop_index("ix_repo_url_processed_annexed_files_in_wt_count")
+        batch_op.drop_index("ix_repo_url_processed_annex_key_count")
+        batch_op.drop_index("ix_repo_url_processed_last_update_dt")
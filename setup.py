@@ -1,3 +1,27 @@
+import os
+
 from setuptools import setup
 
-setup()
+# Modules to compile with Cython, in pure-Python mode, when speedups are enabled.
+# These are the Pydantic-heavy modules on the request hot path.
+SPEEDUP_MODULES = ["datalad_registry/blueprints/api/dataset_urls/models.py"]
+
+
+def get_ext_modules():
+    """
+    Get the extension modules to build
+
+    The modules listed in `SPEEDUP_MODULES` are compiled only if the
+    `DATALAD_REGISTRY_ENABLE_SPEEDUPS` environment variable is set to `1`. Cython must
+    be available in the build environment in that case, e.g., install it beforehand
+    and build with `pip install --no-build-isolation`.
+    """
+    if os.environ.get("DATALAD_REGISTRY_ENABLE_SPEEDUPS") != "1":
+        return []
+
+    from Cython.Build import cythonize
+
+    return cythonize(SPEEDUP_MODULES, language_level=3)
+
+
+setup(ext_modules=get_ext_modules())
@@ -35,7 +35,7 @@ def populate(start: Optional[int], stop: Optional[int]) -> None:
     # Fetch git repo information from the datalad-usage-dashboard
     resp = requests.get(DASHBOARD_COLLECTION_URL)
     resp.raise_for_status()
-    dashboard_collection = DashboardCollection.parse_raw(resp.text)
+    dashboard_collection = DashboardCollection.model_validate_json(resp.text)
 
     # Obtain active GitHub datasets from the listing in datalad-usage-dashboard
     active_github_datasets = [